@@ -1,28 +1,45 @@
 import re
 import io
+import hashlib
+import os
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 
 import streamlit as st
 
-import pdfplumber
-from pypdf import PdfReader, PdfWriter
+import pymupdf
 
 # OCR / image deps (used only if needed)
 from pdf2image import convert_from_bytes
+import img2pdf
 from PIL import Image
 import numpy as np
-import easyocr
+import pytesseract
 
 
 # -------------------------
 # Helpers
 # -------------------------
+# Windows forbidden chars -> "_" (str.translate, one C-level pass)
+_FORBIDDEN_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*' + "".join(map(chr, range(0x20)))})
+_WS_SQUEEZE_RE = re.compile(r"\s+")
+
+_WS_RE = re.compile(r"[ \t]+")
+
+# Capture digits that might contain internal spaces
+_INV_RE = re.compile(
+    r"\bTax\s+Invoice\s+No\.?\s*:?\s*([0-9][0-9\s]{3,})\b",
+    flags=re.IGNORECASE,
+)
+
+
 def safe_filename(s: str, max_len: int = 120) -> str:
     s = (s or "").strip()
-    s = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "_", s)  # Windows forbidden chars
-    s = re.sub(r"\s+", " ", s)
+    s = s.translate(_FORBIDDEN_TABLE)
+    s = " ".join(s.split())
     s = s.strip(" ._")
     return s[:max_len] if len(s) > max_len else s
 
@@ -36,60 +53,397 @@ def extract_tax_invoice_no(text: str) -> Optional[str]:
       - handles weird spacing/newlines
       - handles digits that may be spaced: "1 0 0 7 5 8 5"
     """
-    text = (text or "").replace("\xa0", " ")
-    text = re.sub(r"[ \t]+", " ", text)
+    text = text or ""
+    # Cheap substring prefilter: most continuation pages never mention it.
+    # (A single word, since the regex allows any whitespace between words.)
+    if "invoice" not in text.lower():
+        return None
 
-    # Capture digits that might contain internal spaces
-    m = re.search(
-        r"\bTax\s+Invoice\s+No\.?\s*:?\s*([0-9][0-9\s]{3,})\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _INV_RE.search(_WS_RE.sub(" ", text.replace("\xa0", " ")))
     if not m:
         return None
 
-    digits = re.sub(r"\s+", "", m.group(1))
+    digits = _WS_SQUEEZE_RE.sub("", m.group(1))
     return digits if digits.isdigit() else None
 
 
-def get_invoice_numbers_by_page_pdfplumber(pdf_bytes: bytes) -> List[Optional[str]]:
+# Below this many pages the process pool start-up costs more than it saves
+# (MuPDF extracts a page in a few ms)
+PARALLEL_MIN_PAGES = 64
+
+# Per-worker state for the text-extraction pool (set by the initializer)
+_worker_doc = None
+
+
+def open_pdf(pdf_bytes: bytes) -> pymupdf.Document:
+    return pymupdf.open(stream=pdf_bytes, filetype="pdf")
+
+
+def _extract_raw(page: pymupdf.Page) -> str:
     """
-    Best-effort per-page invoice number extraction using pdfplumber.
+    Decompressed content stream of a page (drawing operators and literal
+    strings, no layout analysis).
     """
-    invs: List[Optional[str]] = []
-    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            invs.append(extract_tax_invoice_no(page_text))
-    return invs
+    return page.read_contents().decode("latin-1", "ignore")
+
+
+# A raw-stream match is only trusted if its digits close the string operand...
+_RAW_STRING_END_RE = re.compile(r"\s*\)")
+# ...and no further string operand follows, literal "(...)" or hex "<...>"
+# (dictionaries "<<...>>" are skipped): the writer may have split the
+# digits, e.g. "(Tax Invoice No: 1007) Tj (585) Tj", "... Tj <353835> Tj"
+# or "[(... No: 1007)-20(585)] TJ", so only get_text() can tell
+_RAW_DIGIT_CONTINUATION_RE = re.compile(r"\s*\)(?:[^(<]|<<[^>]*>>)*(?:\(|<(?!<))")
+
+
+def _raw_invoice_no(raw: str) -> Optional[str]:
+    """
+    Invoice number from a raw content stream, or None when the stream can't
+    be trusted on its own (no match, or digits possibly split across string
+    operands by the PDF writer).
+    """
+    if "invoice" not in raw.lower():
+        return None
+
+    m = _INV_RE.search(raw)
+    if not m:
+        return None
+    if not _RAW_STRING_END_RE.match(raw, m.end()) or _RAW_DIGIT_CONTINUATION_RE.match(raw, m.end()):
+        return None
+
+    digits = _WS_SQUEEZE_RE.sub("", m.group(1))
+    return digits if digits.isdigit() else None
+
+
+def _page_invno(doc: pymupdf.Document, i: int) -> Optional[str]:
+    """
+    Invoice number for page index i (0-based).
+    Tries a cheap regex over the raw content stream first and only runs
+    MuPDF's text extraction when that isn't conclusive (e.g. text drawn
+    with hex/CID-encoded strings, or digits split across Tj/TJ operands).
+    """
+    page = doc[i]
+    inv_no = _raw_invoice_no(_extract_raw(page))
+    if inv_no:
+        return inv_no
+    return extract_tax_invoice_no(page.get_text("text"))
+
+
+def _init_text_worker(pdf_bytes: bytes) -> None:
+    """
+    Open the PDF once per worker process so each task only reads a page.
+    """
+    global _worker_doc
+    _worker_doc = open_pdf(pdf_bytes)
+
+
+def _extract_page_invno(i: int) -> Optional[str]:
+    """
+    Worker task: extract the invoice number from page index i (0-based).
+    """
+    return _page_invno(_worker_doc, i)
+
+
+def iter_invoice_numbers_by_page(pdf_bytes: bytes) -> Iterator[Optional[str]]:
+    """
+    Yield the invoice number (or None) for every page, in page order.
+
+    Very large PDFs are spread across a process pool (one worker per core);
+    MuPDF documents can't be shared between threads.
+    """
+    with open_pdf(pdf_bytes) as doc:
+        n_pages = doc.page_count
+        if n_pages < PARALLEL_MIN_PAGES:
+            for i in range(n_pages):
+                yield _page_invno(doc, i)
+            return
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_text_worker,
+        initargs=(pdf_bytes,),
+    ) as ex:
+        yield from ex.map(_extract_page_invno, range(n_pages), chunksize=4)
+
+
+def _pdf_digest(pdf_bytes: bytes) -> bytes:
+    # Cache key for uploaded PDFs: blake2b is far cheaper than re-parsing
+    return hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={bytes: _pdf_digest})
+def get_invoice_numbers_by_page(pdf_bytes: bytes) -> List[Optional[str]]:
+    """
+    Best-effort per-page invoice number extraction using PyMuPDF.
+    Cached, so the preview and the split share one extraction per upload.
+    """
+    return list(iter_invoice_numbers_by_page(pdf_bytes))
+
+
+# Output pages of the OCR branch are colour "image PDFs" at this resolution
+OUTPUT_DPI = 200
+OUTPUT_JPEG_QUALITY = 90
+
+# OCR runs on a downscaled grayscale copy: 150 DPI is plenty for a printed
+# digit string
+OCR_DPI = 150
+
+# Pages are resized to a common size (~A4/Letter at OCR_DPI) so EasyOCR
+# can batch the detector
+OCR_BATCH_SIZE = 8
+OCR_BATCH_WIDTH = 1280
+OCR_BATCH_HEIGHT = 1650
+
+# Invoices print the number near the top: OCR this band first, and only
+# fall back to the full page when it misses
+HEADER_CROP_FRACTION = 0.22
+OCR_HEADER_HEIGHT = int(OCR_BATCH_HEIGHT * HEADER_CROP_FRACTION)
+
+
+# Tesseract: LSTM engine, page treated as a single uniform block of text
+TESSERACT_CONFIG = "--oem 1 --psm 6"
 
 
 @st.cache_resource
 def get_ocr_reader():
-    # Cached so it doesn't reload models every run
-    return easyocr.Reader(["en"], gpu=False)
+    # Cached so it doesn't reload models every run.
+    # Imported lazily: EasyOCR (torch + models) is only loaded when selected.
+    import easyocr
+
+    # gpu=True falls back to CPU (with a warning) when CUDA isn't available.
+    # quantize=True is already EasyOCR's default (spelled out here, no
+    # behaviour change): on CPU it applies int8 dynamic quantization
+    # (torch.quantization.quantize_dynamic) to both networks at load time.
+    reader = easyocr.Reader(["en"], gpu=True, cudnn_benchmark=True, quantize=True)
+    if reader.device != "cpu":
+        # Warm-up batches (header band + full page) so cuDNN autotuning
+        # isn't paid on the first real split
+        for height in (OCR_HEADER_HEIGHT, OCR_BATCH_HEIGHT):
+            dummy = np.zeros([OCR_BATCH_SIZE, height, OCR_BATCH_WIDTH, 3], np.uint8)
+            reader.readtext_batched(dummy, batch_size=OCR_BATCH_SIZE)
+    return reader
+
+
+def ocr_page_image(image: Image.Image) -> str:
+    """
+    OCR a PIL image via Tesseract (default engine, fastest on CPU).
+    """
+    return pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+
 
+def open_ocr_image(path: str) -> Image.Image:
+    """
+    Grayscale OCR_DPI copy of a page rendered at OUTPUT_DPI.
+    """
+    with Image.open(path) as image:
+        image.draft("L", image.size)  # JPEG: decode the luma channel only
+        gray = image.convert("L")
+    scale = OCR_DPI / OUTPUT_DPI
+    size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+    return gray.resize(size, Image.BILINEAR)
 
-def ocr_page_image(image: Image.Image, reader: easyocr.Reader) -> str:
+
+def image_to_rgb_array(image: Image.Image) -> np.ndarray:
+    """
+    HxWx3 uint8 array for EasyOCR; grayscale pages are stacked to 3 channels.
     """
-    OCR a PIL image via EasyOCR (requires numpy array input).
+    arr = np.asarray(image)
+    if arr.ndim == 2:
+        return np.stack([arr] * 3, axis=-1)
+    if arr.shape[-1] != 3:
+        return np.asarray(image.convert("RGB"))
+    return arr
+
+
+def easyocr_page_images(
+    images: List[Image.Image],
+    reader,
+    n_height: int = OCR_BATCH_HEIGHT,
+) -> List[str]:
     """
-    img_np = np.array(image.convert("RGB"))
-    results = reader.readtext(img_np)
-    return " ".join([r[1] for r in results if r and len(r) > 1])
+    OCR a list of PIL images via EasyOCR in batches (one text string per image).
+    """
+    if not images:
+        return []  # readtext_batched rejects an empty batch
+
+    arrays = [image_to_rgb_array(im) for im in images]
+    batch_results = reader.readtext_batched(
+        arrays,
+        n_width=OCR_BATCH_WIDTH,
+        n_height=n_height,
+        batch_size=OCR_BATCH_SIZE,
+    )
+    return [
+        " ".join([r[1] for r in results if r and len(r) > 1])
+        for results in batch_results
+    ]
 
 
-def page_image_to_single_page_pdf_bytes(image: Image.Image) -> bytes:
+def ocr_page_images(
+    images: List[Image.Image],
+    use_easyocr: bool = False,
+    n_height: int = OCR_BATCH_HEIGHT,
+) -> List[str]:
     """
-    Save a PIL image as a 1-page PDF (bytes).
-    Note: OCR fallback outputs "image PDFs" (not vector).
+    OCR a list of PIL images with the selected engine (one text string per image).
+    n_height is the EasyOCR batch resize height (ignored by Tesseract).
     """
-    buf = io.BytesIO()
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-    image.save(buf, format="PDF")
-    buf.seek(0)
-    return buf.read()
+    if use_easyocr:
+        return easyocr_page_images(images, get_ocr_reader(), n_height=n_height)
+    return [ocr_page_image(image) for image in images]
+
+
+def crop_header(image: Image.Image, fraction: float = HEADER_CROP_FRACTION) -> Image.Image:
+    """
+    Return the top band of the page where the Tax Invoice No is printed.
+    """
+    w, h = image.size
+    return image.crop((0, 0, w, max(1, int(h * fraction))))
+
+
+def ocr_invoice_numbers(images: List[Image.Image], use_easyocr: bool = False) -> List[Optional[str]]:
+    """
+    Per-page invoice numbers via OCR.
+    The header band is OCR'd first; only pages that miss get a full-page pass.
+    """
+    headers = [crop_header(image) for image in images]
+    header_texts = ocr_page_images(headers, use_easyocr=use_easyocr, n_height=OCR_HEADER_HEIGHT)
+    invs = [extract_tax_invoice_no(text) for text in header_texts]
+
+    missed = [i for i, inv_no in enumerate(invs) if not inv_no]
+    if missed:
+        full_texts = ocr_page_images([images[i] for i in missed], use_easyocr=use_easyocr)
+        for i, text in zip(missed, full_texts):
+            invs[i] = extract_tax_invoice_no(text)
+
+    return invs
+
+
+# Per-worker state for the OCR pool (set by the initializer)
+_worker_pdf_bytes = None
+_worker_ocr_memo: Dict[bytes, Optional[str]] = {}
+
+
+def _file_digest(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+def _ocr_page_range(
+    pdf_bytes: bytes,
+    first_page: int,
+    last_page: int,
+    use_easyocr: bool = False,
+    thread_count: int = 1,
+    memo: Optional[Dict[bytes, Optional[str]]] = None,
+) -> List[Tuple[int, Optional[str], bytes]]:
+    """
+    Render pages first_page..last_page (1-based, inclusive) to a temp dir,
+    OCR them and return (page_num, inv_no, single_page_pdf_bytes) per page.
+    Note: OCR fallback outputs "image PDFs" (not vector). Pages are rendered
+    in colour at OUTPUT_DPI and img2pdf wraps that JPEG as-is (DCTDecode);
+    OCR only sees a grayscale OCR_DPI copy.
+
+    memo maps a digest of the rendered page to its OCR result, so repeated
+    pages (cover sheets, T&Cs) are only OCR'd once.
+    """
+    if memo is None:
+        memo = {}
+
+    out = []
+    with tempfile.TemporaryDirectory() as td:
+        paths = convert_from_bytes(
+            pdf_bytes,
+            dpi=OUTPUT_DPI,
+            thread_count=thread_count,
+            fmt="jpeg",
+            jpegopt={"quality": OUTPUT_JPEG_QUALITY},
+            output_folder=td,
+            paths_only=True,
+            first_page=first_page,
+            last_page=last_page,
+        )
+        digests = [_file_digest(path) for path in paths]
+
+        # Only OCR pages not seen before (in this batch or an earlier one)
+        todo = []
+        pending = set()
+        for k, digest in enumerate(digests):
+            if digest not in memo and digest not in pending:
+                pending.add(digest)
+                todo.append(k)
+
+        if todo:
+            images = [open_ocr_image(paths[k]) for k in todo]
+            for k, inv_no in zip(todo, ocr_invoice_numbers(images, use_easyocr=use_easyocr)):
+                memo[digests[k]] = inv_no
+            for image in images:
+                image.close()
+
+        for page_num, (path, digest) in enumerate(zip(paths, digests), start=first_page):
+            out.append((page_num, memo[digest], img2pdf.convert(path)))
+
+    return out
+
+
+def _init_ocr_worker(pdf_bytes: bytes) -> None:
+    """
+    Hand the PDF to each OCR worker once instead of pickling it per task.
+    """
+    # The pool already uses every core: keep each Tesseract call (a child
+    # process that inherits this environment) to one OpenMP thread
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+    global _worker_pdf_bytes, _worker_ocr_memo
+    _worker_pdf_bytes = pdf_bytes
+    _worker_ocr_memo = {}
+
+
+def _ocr_worker_range(page_range: Tuple[int, int]) -> List[Tuple[int, Optional[str], bytes]]:
+    """
+    Worker task: Tesseract OCR for one (first_page, last_page) range.
+    """
+    first_page, last_page = page_range
+    return _ocr_page_range(_worker_pdf_bytes, first_page, last_page, memo=_worker_ocr_memo)
+
+
+def iter_ocr_pages(pdf_bytes: bytes, use_easyocr: bool = False) -> Iterator[Tuple[int, Optional[str], bytes]]:
+    """
+    Yield (page_num, inv_no, single_page_pdf_bytes) for every page, in order.
+
+    Pages are rendered and OCR'd OCR_BATCH_SIZE at a time, so only one batch
+    of page images is held in memory per process. Tesseract batches are
+    spread over a process pool (render + OCR per core). EasyOCR stays in
+    this process: one model copy, and CUDA state can't be shared with
+    forked workers.
+    """
+    with open_pdf(pdf_bytes) as doc:
+        n_pages = doc.page_count
+    ranges = [
+        (first, min(first + OCR_BATCH_SIZE - 1, n_pages))
+        for first in range(1, n_pages + 1, OCR_BATCH_SIZE)
+    ]
+
+    if use_easyocr or len(ranges) < 2:
+        memo: Dict[bytes, Optional[str]] = {}
+        for first, last in ranges:
+            yield from _ocr_page_range(
+                pdf_bytes,
+                first,
+                last,
+                use_easyocr=use_easyocr,
+                thread_count=os.cpu_count(),
+                memo=memo,
+            )
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_ocr_worker,
+        initargs=(pdf_bytes,),
+    ) as ex:
+        for results in ex.map(_ocr_worker_range, ranges):
+            yield from results
 
 
 def build_unique_filename(base: str, used_names: set, page_num: int) -> str:
@@ -109,61 +463,83 @@ def build_unique_filename(base: str, used_names: set, page_num: int) -> str:
     return filename
 
 
-def split_pdf_to_zip(pdf_bytes: bytes, skip_unmatched: bool, force_ocr: bool) -> bytes:
+# PDF page streams are already Flate/DCT-compressed, so ZIP entries are
+# stored rather than run through zlib a second time
+ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+
+def split_text_pdf_to_zip(pdf_bytes: bytes, skip_unmatched: bool) -> Optional[bytes]:
     """
-    Strategy:
-      1) Use pdfplumber per-page text extraction (best for invoices)
-      2) If still no hits anywhere OR force_ocr=True, fall back to OCR
+    Split a PDF with a text layer in a single pass over its pages, using the
+    (cached) per-page invoice numbers.
+    Returns None (caller falls back to OCR) if no page has a Tax Invoice No.
     """
+    # Usually already computed (and cached) by the preview
+    invs = get_invoice_numbers_by_page(pdf_bytes)
+    if not any(invs):
+        return None
+
     zip_buffer = io.BytesIO()
     used_names = set()
 
-    # Text-first using pdfplumber
-    invs = []
-    if not force_ocr:
-        invs = get_invoice_numbers_by_page_pdfplumber(pdf_bytes)
-
-    any_found = any(invs) if invs else False
-
-    with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        if any_found and not force_ocr:
-            # Split using pypdf (keeps original PDF quality)
-            reader = PdfReader(io.BytesIO(pdf_bytes))
-
-            for i, page in enumerate(reader.pages, start=1):
-                inv_no = invs[i - 1] if (i - 1) < len(invs) else None
-
+    with open_pdf(pdf_bytes) as src:
+        # One scratch buffer is reused for every page, and its contents are
+        # handed to the ZIP as a memoryview (no per-page allocation or copy)
+        out_pdf = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", compression=ZIP_COMPRESSION) as zf:
+            for i, inv_no in enumerate(invs, start=1):
                 if not inv_no and skip_unmatched:
                     continue
 
                 base = inv_no if inv_no else f"unmatched_page_{i:02d}"
                 filename = build_unique_filename(base, used_names, i)
 
-                writer = PdfWriter()
-                writer.add_page(page)
+                # PyMuPDF keeps original PDF quality; MuPDF's C writer copies
+                # just the objects each page needs
+                with pymupdf.open() as dst:
+                    dst.insert_pdf(src, from_page=i - 1, to_page=i - 1)
 
-                out_pdf = io.BytesIO()
-                writer.write(out_pdf)
-                out_pdf.seek(0)
+                    out_pdf.seek(0)
+                    out_pdf.truncate()
+                    dst.save(out_pdf)
 
-                zf.writestr(filename, out_pdf.read())
+                with out_pdf.getbuffer() as view:
+                    zf.writestr(filename, view)
 
-        else:
-            # OCR fallback (slow, but works for scanned PDFs)
-            ocr_reader = get_ocr_reader()
-            images = convert_from_bytes(pdf_bytes, dpi=200)
+    zip_buffer.seek(0)
+    return zip_buffer.read()
 
-            for i, image in enumerate(images, start=1):
-                ocr_text = ocr_page_image(image, ocr_reader)
-                inv_no = extract_tax_invoice_no(ocr_text)
 
-                if not inv_no and skip_unmatched:
-                    continue
+def split_pdf_to_zip(
+    pdf_bytes: bytes,
+    skip_unmatched: bool,
+    force_ocr: bool,
+    use_easyocr: bool = False,
+) -> bytes:
+    """
+    Strategy:
+      1) Use PyMuPDF per-page text extraction (best for invoices)
+      2) If still no hits anywhere OR force_ocr=True, fall back to OCR
+         (Tesseract by default, EasyOCR if use_easyocr=True)
+    """
+    if not force_ocr:
+        zip_bytes = split_text_pdf_to_zip(pdf_bytes, skip_unmatched)
+        if zip_bytes is not None:
+            return zip_bytes
 
-                base = inv_no if inv_no else f"unmatched_page_{i:02d}"
-                filename = build_unique_filename(base, used_names, i)
+    zip_buffer = io.BytesIO()
+    used_names = set()
+
+    with zipfile.ZipFile(zip_buffer, "w", compression=ZIP_COMPRESSION) as zf:
+        # OCR fallback (slow, but works for scanned PDFs)
+        for i, inv_no, page_pdf in iter_ocr_pages(pdf_bytes, use_easyocr=use_easyocr):
+            if not inv_no and skip_unmatched:
+                continue
 
-                zf.writestr(filename, page_image_to_single_page_pdf_bytes(image))
+            base = inv_no if inv_no else f"unmatched_page_{i:02d}"
+            filename = build_unique_filename(base, used_names, i)
+
+            zf.writestr(filename, page_pdf)
 
     zip_buffer.seek(0)
     return zip_buffer.read()
@@ -178,6 +554,12 @@ st.title("PDF Splitter — filename = Tax Invoice No (e.g. 1007585.pdf)")
 uploaded = st.file_uploader("Upload PDF", type=["pdf"])
 skip_unmatched = st.checkbox("Skip pages without a Tax Invoice No", value=False)
 force_ocr = st.checkbox("Force OCR (slower — only for scanned PDFs)", value=False)
+use_easyocr = st.checkbox("Use EasyOCR instead of Tesseract (slower — for unusual fonts)", value=False)
+
+if use_easyocr:
+    # Load the models as soon as the engine is picked, not on the Split click
+    with st.spinner("Loading EasyOCR models..."):
+        get_ocr_reader()
 
 if uploaded:
     pdf_bytes = uploaded.getvalue()
@@ -185,8 +567,8 @@ if uploaded:
     st.subheader("Preview (first 8 pages)")
     preview = []
 
-    # Preview uses pdfplumber (more reliable than pypdf for invoice text)
-    invs = get_invoice_numbers_by_page_pdfplumber(pdf_bytes)
+    # Preview uses the same text extraction as the split
+    invs = get_invoice_numbers_by_page(pdf_bytes)
 
     for i in range(1, min(8, len(invs)) + 1):
         inv_no = invs[i - 1]
@@ -207,6 +589,7 @@ if uploaded:
                 pdf_bytes,
                 skip_unmatched=skip_unmatched,
                 force_ocr=force_ocr,
+                use_easyocr=use_easyocr,
             )
             ts = datetime.now().strftime("%Y%m%d-%H%M%S")
             st.download_button(
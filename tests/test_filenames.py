@@ -0,0 +1,52 @@
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+for mod in ("streamlit", "pymupdf", "pdf2image", "img2pdf", "PIL", "numpy", "pytesseract"):
+    pytest.importorskip(mod)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import PDF_Splitter as ps  # noqa: E402
+
+
+def regex_safe_filename(s: str, max_len: int = 120) -> str:
+    """
+    The original regex-based safe_filename, kept as the reference.
+    """
+    s = (s or "").strip()
+    s = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "_", s)
+    s = re.sub(r"\s+", " ", s)
+    s = s.strip(" ._")
+    return s[:max_len] if len(s) > max_len else s
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('a<b>c:d"e/f\\g|h?i*j', "a_b_c_d_e_f_g_h_i_j"),
+        ("inv\x00\x01\x1f no", "inv___ no"),
+        ("tab\tnew\nline", "tab_new_line"),  # control chars, not whitespace
+        ("wide　 space\xa0here", "wide space here"),
+        ("  ._1007585._  ", "1007585"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_safe_filename(raw, expected):
+    assert ps.safe_filename(raw) == expected
+
+
+def test_safe_filename_truncates():
+    assert ps.safe_filename("9" * 200) == "9" * 120
+
+
+def test_safe_filename_matches_regex_version():
+    alphabet = 'ab1 ._<>:"/\\|?*' + "".join(map(chr, range(0x20))) + "\xa0 　 "
+    rng = random.Random(0)
+    for _ in range(20000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert ps.safe_filename(s) == regex_safe_filename(s), repr(s)
@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+for mod in ("streamlit", "pymupdf", "pdf2image", "img2pdf", "PIL", "numpy", "pytesseract"):
+    pytest.importorskip(mod)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pymupdf  # noqa: E402
+
+import PDF_Splitter as ps  # noqa: E402
+
+
+def make_pdf(content: bytes) -> bytes:
+    """
+    One-page PDF with Helvetica available as /helv and the given content stream.
+    """
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), " ", fontname="helv")  # registers the font resource
+    doc.update_stream(page.get_contents()[0], content)
+    return doc.tobytes()
+
+
+def test_raw_invoice_no_whole_operand():
+    assert ps._raw_invoice_no("BT (Tax Invoice No: 1007585) Tj ET") == "1007585"
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "BT (Tax Invoice No: 1007) Tj (585) Tj ET",
+        "BT [(Tax Invoice No: 1007)-20(585)] TJ ET",
+        "BT (Tax Invoice No: 1007) Tj <353835> Tj ET",
+        "BT [(Tax Invoice No: 1007) -20 <353835>] TJ ET",
+    ],
+)
+def test_raw_invoice_no_rejects_split_digits(raw):
+    assert ps._raw_invoice_no(raw) is None
+
+
+@pytest.mark.parametrize(
+    "operands",
+    [
+        b"(Tax Invoice No: 1007) Tj (585) Tj",
+        b"(Tax Invoice No: 1007) Tj <353835> Tj",
+        b"[(Tax Invoice No: 1007) -20 <353835>] TJ",
+    ],
+)
+def test_page_invno_split_digit_stream(operands):
+    pdf_bytes = make_pdf(b"BT /helv 11 Tf 72 720 Td " + operands + b" ET")
+    with ps.open_pdf(pdf_bytes) as doc:
+        assert ps._page_invno(doc, 0) == "1007585"
@@ -0,0 +1,132 @@
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+for mod in ("streamlit", "pymupdf", "pdf2image", "img2pdf", "PIL", "numpy", "pytesseract"):
+    pytest.importorskip(mod)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pymupdf  # noqa: E402
+from PIL import Image  # noqa: E402
+
+import PDF_Splitter as ps  # noqa: E402
+
+
+def png_bytes(color=(200, 30, 30)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (60, 80), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_image_pages_before_text_invoices_split_by_text_layer():
+    """
+    Image-only leading pages (scanned cover, image letterhead) must not send
+    a PDF whose later pages carry invoice text down the OCR branch.
+    """
+    doc = pymupdf.open()
+    for _ in range(4):
+        page = doc.new_page()
+        page.insert_image(page.rect, stream=png_bytes())
+    for inv_no in ("2000000", "2000001", "2000002"):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Tax Invoice No: {inv_no}")
+    pdf_bytes = doc.tobytes()
+
+    zip_bytes = ps.split_text_pdf_to_zip(pdf_bytes, skip_unmatched=False)
+
+    assert zip_bytes is not None
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+        assert zf.namelist() == [
+            "unmatched_page_01.pdf",
+            "unmatched_page_02.pdf",
+            "unmatched_page_03.pdf",
+            "unmatched_page_04.pdf",
+            "2000000.pdf",
+            "2000001.pdf",
+            "2000002.pdf",
+        ]
+
+
+class FakeScan:
+    """
+    Stands in for pdf2image + Tesseract: each page is a flat gray JPEG whose
+    level identifies it, and "OCR" reads the level back as an invoice number.
+    """
+
+    def __init__(self, levels):
+        self.levels = levels
+        self.ocr_calls = 0
+
+    def convert_from_bytes(self, pdf_bytes, first_page, last_page, output_folder, **kwargs):
+        paths = []
+        for page_num in range(first_page, last_page + 1):
+            path = str(Path(output_folder) / f"page-{page_num:04d}.jpg")
+            Image.new("RGB", (200, 260), (self.levels[page_num - 1],) * 3).save(path, format="JPEG")
+            paths.append(path)
+        return paths
+
+    def ocr_page_image(self, image):
+        self.ocr_calls += 1
+        level = sum(image.convert("L").getdata()) / (image.width * image.height)
+        return f"Tax Invoice No: {self.inv_no(round(level))}"
+
+    @staticmethod
+    def inv_no(level):
+        return str(1000 + round(level / 50))
+
+
+@pytest.fixture
+def fake_scan(monkeypatch):
+    def install(levels):
+        scan = FakeScan(levels)
+        monkeypatch.setattr(ps, "convert_from_bytes", scan.convert_from_bytes)
+        monkeypatch.setattr(ps, "ocr_page_image", scan.ocr_page_image)
+        return scan
+
+    return install
+
+
+def expected_invs(levels, first_page, last_page):
+    return [FakeScan.inv_no(level) for level in levels[first_page - 1:last_page]]
+
+
+def test_ocr_memo_duplicates_within_batch(fake_scan):
+    levels = [0, 0, 50, 50, 100, 0, 50, 100]
+    scan = fake_scan(levels)
+
+    out = ps._ocr_page_range(b"", 1, 8, memo={})
+
+    assert scan.ocr_calls == 3
+    assert [page_num for page_num, _, _ in out] == list(range(1, 9))
+    assert [inv_no for _, inv_no, _ in out] == expected_invs(levels, 1, 8)
+
+
+def test_ocr_memo_hit_against_earlier_batch(fake_scan):
+    levels = [0, 50, 100, 0, 150, 50]
+    scan = fake_scan(levels)
+    memo = {}
+
+    first = ps._ocr_page_range(b"", 1, 3, memo=memo)
+    second = ps._ocr_page_range(b"", 4, 6, memo=memo)
+
+    assert scan.ocr_calls == 4  # 0, 50, 100, then only 150 is new
+    assert [inv_no for _, inv_no, _ in first] == expected_invs(levels, 1, 3)
+    assert [inv_no for _, inv_no, _ in second] == expected_invs(levels, 4, 6)
+
+
+def test_ocr_memo_all_duplicate_batch(fake_scan):
+    levels = [0, 50, 0, 50, 50]
+    scan = fake_scan(levels)
+    memo = {}
+
+    ps._ocr_page_range(b"", 1, 2, memo=memo)
+    out = ps._ocr_page_range(b"", 3, 5, memo=memo)
+
+    assert scan.ocr_calls == 2
+    assert [page_num for page_num, _, _ in out] == [3, 4, 5]
+    assert [inv_no for _, inv_no, _ in out] == expected_invs(levels, 3, 5)
+    assert all(page_pdf.startswith(b"%PDF") for _, _, page_pdf in out)